@@ -0,0 +1,55 @@
+# Car-ticks per second of ElevatorSystem.step(n_ticks) on the Python and kernel backends.
+#
+#   python benchmarks/bench_kernel.py --elevators 64 --ticks 200000 --out kernel.json
+import argparse
+import json
+import random
+import time
+
+from elevator_sim import Direction, ElevatorSystem
+from elevator_sim import kernel
+
+
+def run(backend, args):
+    rng = random.Random(args.seed)
+    system = ElevatorSystem(args.elevators, backend=backend)
+    started = time.perf_counter()
+    for _ in range(args.ticks // args.batch):
+        # Fresh car calls between batches keep every car busy
+        for elevator in system.elevators:
+            floor = rng.randint(0, args.floors - 1)
+            elevator.add_destination(floor, Direction.UP if floor > elevator.current_floor else Direction.DOWN)
+        system.step(args.batch)
+    elapsed = time.perf_counter() - started
+    car_ticks = args.elevators * (args.ticks // args.batch) * args.batch
+    return dict(benchmark='kernel', backend=backend, traffic=f'batch {args.batch}', elevators=args.elevators,
+                floors=args.floors, ticks=args.ticks, seed=args.seed, ticks_per_s=car_ticks / args.elevators / elapsed,
+                car_ticks_per_s=car_ticks / elapsed, numba=kernel.HAVE_NUMBA)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the Python and kernel stepping backends")
+    parser.add_argument('-e', '--elevators', type=int, default=64)
+    parser.add_argument('--floors', type=int, default=40)
+    parser.add_argument('-t', '--ticks', type=int, default=20000)
+    parser.add_argument('--batch', type=int, default=100, help="ticks per step(n_ticks) call")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--out', metavar='PATH', help="write the results as JSON")
+    args = parser.parse_args()
+
+    if kernel.HAVE_NUMBA:
+        # Compile outside the timed runs (single ticks don't go through the kernel)
+        ElevatorSystem(1, backend='kernel').step(2)
+
+    results = [run(backend, args) for backend in ('python', 'kernel')]
+    for result in results:
+        print(f"{result['backend']:<8}{result['car_ticks_per_s']:>14,.0f} car-ticks/s")
+    print(f"numba: {'yes' if kernel.HAVE_NUMBA else 'no, pure-Python kernel'}")
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Wait times with and without idle-car parking on the built-in traffic profiles.
+#
+#   python benchmarks/bench_parking.py --ticks 40000 --out parking.json
+import argparse
+import json
+import time
+
+from elevator_sim import ElevatorSystem
+from elevator_sim.dispatch import get_policy
+from elevator_sim.metrics import WaitStats
+from elevator_sim.parking import ParkingStrategy
+from elevator_sim.simulation import Simulation
+from elevator_sim.traffic import get_profile
+
+PROFILES = ('uniform', 'up_peak', 'down_peak', 'lunch', 'office_day')
+
+
+def run(profile_name, policy, parking, args):
+    traffic = get_profile(profile_name)
+    system = ElevatorSystem(args.elevators, dispatch=get_policy(policy))
+    strategy = ParkingStrategy(args.min_floor, args.max_floor, traffic.day_length) if parking else None
+    simulation = Simulation(system, traffic, args.min_floor, args.max_floor, seed=args.seed, parking=strategy)
+
+    waits = WaitStats()
+    started = time.perf_counter()
+    for _ in range(args.ticks):
+        for passenger in simulation.step():
+            if passenger.arrival_tick >= args.warmup:
+                waits.add(passenger.board_tick - passenger.arrival_tick)
+    elapsed = time.perf_counter() - started
+
+    return dict(benchmark='parking', traffic=profile_name, policy=policy, parking=parking,
+                elevators=args.elevators, floors=args.max_floor - args.min_floor + 1, ticks=args.ticks,
+                seed=args.seed, ticks_per_s=args.ticks / elapsed, utilization=simulation.utilization(),
+                **waits.summary())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare wait times with and without idle-car parking")
+    parser.add_argument('-e', '--elevators', type=int, default=4)
+    parser.add_argument('--min-floor', type=int, default=0)
+    parser.add_argument('--max-floor', type=int, default=15)
+    parser.add_argument('--policy', action='append', help="dispatch policies to compare (default: all)")
+    parser.add_argument('-t', '--ticks', type=int, default=40000)
+    parser.add_argument('--warmup', type=int, default=2000, help="ticks the demand model learns before measuring")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--out', metavar='PATH', help="write the results as JSON")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'profile':<12}{'policy':<12}{'mean':>7}{'parked':>8}{'p95':>6}{'parked':>8}")
+    for profile_name in PROFILES:
+        for policy in args.policy or ('least_busy', 'nearest', 'energy'):
+            base = run(profile_name, policy, False, args)
+            parked = run(profile_name, policy, True, args)
+            results += [base, parked]
+            print(f"{profile_name:<12}{policy:<12}{base['mean']:>7.2f}{parked['mean']:>8.2f}"
+                  f"{base['p95']:>6}{parked['p95']:>8}")
+
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
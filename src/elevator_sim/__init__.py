@@ -0,0 +1,17 @@
+from .direction import Direction
+from .elevator import Elevator
+from .elevatorsystem import ElevatorSystem
+
+__all__ = ['Direction', 'Elevator', 'ElevatorSystem']
+
+# The Tk front-end (and Graphviz/PIL behind it) is only imported when asked for,
+# so headless users of the core never pay for it. Its names stay out of __all__ so
+# that a star import doesn't pull it in.
+_GUI_NAMES = {'ElevatorSystemGUI', 'ask_elevator_config', 'start_main_app'}
+
+
+def __getattr__(name):
+    if name in _GUI_NAMES:
+        from . import gui
+        return getattr(gui, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,300 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+from .dispatch import POLICIES, EnergyAwareDispatch, get_policy
+from .elevatorsystem import ElevatorSystem
+from .energy import EnergyModel
+from .equivalence import ENGINES, fuzz, fuzz_random
+from .faults import MAINTENANCE, FaultInjector, degradation, random_schedule
+from .metrics import WaitStats
+from .output import SINKS, open_sink
+from .parking import ParkingStrategy
+from .simulation import PASSENGER_FIELDS, STATUS_FIELDS, Simulation
+from .traffic import PROFILES, get_profile
+
+
+def parse_pickup(value):
+    try:
+        floor, direction = value.split(':')
+        return int(floor), int(direction)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected FLOOR:DIRECTION, got {value!r}")
+
+
+def parse_maintenance(value):
+    try:
+        elevator_id, start, duration = map(int, value.split(':'))
+        return elevator_id, start, duration
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ELEVATOR:START:DURATION, got {value!r}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='elevator-sim', description="Elevator System Simulation")
+    commands = parser.add_subparsers(dest='command')
+
+    commands.add_parser('gui', help="launch the Tk front-end (default)")
+
+    simulation_args = argparse.ArgumentParser(add_help=False)
+    simulation_args.add_argument('-e', '--elevators', type=int, default=4)
+    simulation_args.add_argument('--min-floor', type=int, default=0)
+    simulation_args.add_argument('--max-floor', type=int, default=9)
+    simulation_args.add_argument('--policy', choices=POLICIES, default='least_busy', help="dispatch policy")
+    simulation_args.add_argument('--energy-slack', type=int, default=2,
+                                 help="extra ticks of wait the energy policy may trade for less travel")
+    simulation_args.add_argument('--traffic', choices=PROFILES, default='uniform', help="traffic profile")
+    simulation_args.add_argument('--rate-scale', type=float, default=1.0,
+                                 help="multiplier on the profile's arrival rate")
+    simulation_args.add_argument('--parking', action='store_true',
+                                 help="send idle cars to the floors where hall calls are expected next")
+    simulation_args.add_argument('-t', '--ticks', type=int, default=10, help="duration of the run in ticks")
+    simulation_args.add_argument('--seed', type=int, default=None)
+    simulation_args.add_argument('--outage-rate', type=float, default=0.0,
+                                 help="random outages per car per 1000 ticks")
+    simulation_args.add_argument('--door-fault-rate', type=float, default=0.0,
+                                 help="random door faults per car per 1000 ticks")
+    simulation_args.add_argument('--slowdown-rate', type=float, default=0.0,
+                                 help="random half-speed spells per car per 1000 ticks")
+    simulation_args.add_argument('--fault-duration', type=float, default=200,
+                                 help="mean length of a random fault in ticks")
+    simulation_args.add_argument('--maintenance', type=parse_maintenance, action='append', default=[],
+                                 metavar='ELEVATOR:START:DURATION', help="planned maintenance window")
+
+    run = commands.add_parser('run', parents=[simulation_args], help="run a configured simulation headless")
+    run.add_argument('-p', '--pickup', type=parse_pickup, action='append', default=[],
+                     metavar='FLOOR:DIRECTION', help="hall call issued before the first tick")
+    run.add_argument('--status-out', metavar='PATH', help="per-tick elevator status output file")
+    run.add_argument('--passengers-out', metavar='PATH', help="per-passenger results output file")
+    run.add_argument('--metrics-out', metavar='PATH', help="run summary as JSON, the input of elevator-sim report")
+    run.add_argument('--format', choices=SINKS, default=None,
+                     help="output format (default: from the file extension, csv otherwise)")
+    run.add_argument('--chunk-size', type=int, default=10000, help="rows buffered before each write")
+    run.add_argument('-v', '--verbose', action='store_true', help="print the status after every tick")
+
+    faults = commands.add_parser('faults', parents=[simulation_args],
+                                 help="wait-time percentiles as more cars are out of service")
+    faults.add_argument('--max-failed', type=int, default=None,
+                        help="most cars out of service (default: all but one)")
+    faults.add_argument('--out', metavar='PATH', help="write the results as JSON, readable by elevator-sim report")
+
+    verify = commands.add_parser('verify', help="fuzz an engine against the reference model")
+    verify.add_argument('--engine', choices=ENGINES, default='reference')
+    verify.add_argument('--examples', type=int, default=200, help="number of randomized scripts")
+    verify.add_argument('--seed', type=int, default=None)
+    verify.add_argument('--no-hypothesis', action='store_true',
+                        help="draw scripts with the random module instead of Hypothesis")
+
+    report = commands.add_parser('report', help="compare recorded runs in a static HTML/PNG report")
+    report.add_argument('inputs', nargs='+', metavar='METRICS',
+                        help="JSON from run --metrics-out or from the benchmarks")
+    report.add_argument('-o', '--output', default='report.html', help="HTML report path")
+    report.add_argument('--png', metavar='PATH', help="also render the charts to a PNG (needs matplotlib)")
+    report.add_argument('--recompute', action='store_true',
+                        help="recompute waits and utilization from the recorded trace files")
+    return parser
+
+
+def build_simulation(args, faults=None):
+    if args.elevators <= 0:
+        raise ValueError("Number of elevators must be positive")
+    if args.min_floor >= args.max_floor:
+        raise ValueError("Minimum floor must be less than maximum floor")
+    if args.energy_slack < 0:
+        raise ValueError("Energy slack must not be negative")
+    if args.policy == 'energy':
+        policy = EnergyAwareDispatch(args.energy_slack)
+    else:
+        policy = get_policy(args.policy)
+    system = ElevatorSystem(args.elevators, dispatch=policy)
+    traffic = get_profile(args.traffic)
+    parking = ParkingStrategy(args.min_floor, args.max_floor, traffic.day_length) if args.parking else None
+    return Simulation(system, traffic, args.min_floor, args.max_floor,
+                      seed=args.seed, rate_scale=args.rate_scale, parking=parking, faults=faults)
+
+
+def build_schedule(args):
+    for name, rate in (('Outage', args.outage_rate), ('Door fault', args.door_fault_rate),
+                       ('Slowdown', args.slowdown_rate)):
+        if rate < 0:
+            raise ValueError(f"{name} rate must not be negative")
+    if args.fault_duration <= 0:
+        raise ValueError("Fault duration must be positive")
+    # Faults draw from their own generator so that the traffic is the same with or without them
+    schedule = random_schedule(random.Random(args.seed), args.elevators, args.ticks,
+                               args.outage_rate / 1000, args.door_fault_rate / 1000, args.slowdown_rate / 1000,
+                               args.fault_duration)
+    for elevator_id, start, duration in args.maintenance:
+        if not 0 <= elevator_id < args.elevators:
+            raise ValueError(f"No elevator {elevator_id} to maintain")
+        if start < 0 or duration <= 0:
+            raise ValueError("Maintenance needs a start tick of 0 or more and a positive duration")
+        schedule.add(MAINTENANCE, elevator_id, start, duration)
+    return schedule
+
+
+def run_headless(args):
+    try:
+        for floor, direction in args.pickup:
+            if not args.min_floor <= floor <= args.max_floor:
+                raise ValueError(f"Pickup floor {floor} is outside floors {args.min_floor}..{args.max_floor}")
+            if direction not in (1, -1):
+                raise ValueError(f"Pickup direction must be 1 (up) or -1 (down), got {direction}")
+        schedule = build_schedule(args)
+        simulation = build_simulation(args, FaultInjector(schedule) if schedule else None)
+        status_sink = open_sink(args.status_out, STATUS_FIELDS, args.format, args.chunk_size)
+        passenger_sink = open_sink(args.passengers_out, PASSENGER_FIELDS, args.format, args.chunk_size)
+    except (ValueError, RuntimeError) as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 2
+
+    for floor, direction in args.pickup:
+        simulation.system.pickup(floor, direction)
+        simulation.calls += 1
+
+    waits = WaitStats()
+    started = time.perf_counter()
+    with status_sink, passenger_sink:
+        for _ in range(args.ticks):
+            for passenger in simulation.step():
+                passenger_sink.write(passenger.record())
+                waits.add(passenger.board_tick - passenger.arrival_tick)
+            status_sink.write_many(simulation.status())
+            if args.verbose:
+                print(f'tick {simulation.tick}')
+                print(simulation.system)
+    elapsed = time.perf_counter() - started
+
+    if not args.verbose:
+        print(simulation.system)
+    print_summary(simulation, elapsed, waits)
+    if simulation.faults is not None:
+        summary = simulation.faults.summary()
+        print(', '.join(f"{kind.replace('_', ' ')}: {count}" for kind, count in summary['faults'].items())
+              + f", car-ticks out of service: {summary['out_of_service_ticks']}")
+    if args.metrics_out:
+        with open(args.metrics_out, 'w') as f:
+            json.dump(run_metrics(args, simulation, elapsed, waits), f, indent=2)
+    return 0
+
+
+def run_metrics(args, simulation, elapsed, waits):
+    elevators = simulation.system.elevators
+    elapsed = max(elapsed, 1e-9)
+    return dict(
+        benchmark='run', policy=args.policy, traffic=args.traffic, parking=args.parking,
+        elevators=args.elevators, floors=args.max_floor - args.min_floor + 1, ticks=simulation.tick,
+        seed=args.seed, calls=simulation.calls, ticks_per_s=simulation.tick / elapsed,
+        calls_per_s=simulation.calls / elapsed, utilization=simulation.utilization(),
+        odometer=sum(e.odometer for e in elevators), reversals=sum(e.reversals for e in elevators),
+        door_cycles=sum(e.door_cycles for e in elevators), energy=EnergyModel().total_energy(elevators),
+        status_file=args.status_out and os.path.abspath(args.status_out),
+        passengers_file=args.passengers_out and os.path.abspath(args.passengers_out),
+        **waits.summary())
+
+
+def print_summary(simulation, elapsed, waits):
+    elapsed = max(elapsed, 1e-9)
+    print(f'ticks: {simulation.tick}, calls: {simulation.calls}, delivered: {waits.count}, '
+          f'in flight: {simulation.in_flight()}')
+    if waits.count:
+        print(f'wait: mean {waits.mean():.2f}, p50 {waits.percentile(50)}, p95 {waits.percentile(95)}, '
+              f'max {waits.percentile(100)} ticks')
+    elevators = simulation.system.elevators
+    print(f'car-floors travelled: {sum(e.odometer for e in elevators)}, '
+          f'reversals: {sum(e.reversals for e in elevators)}, '
+          f'door cycles: {sum(e.door_cycles for e in elevators)}, '
+          f'energy: {EnergyModel().total_energy(elevators):.2f} units')
+    print(f'throughput: {simulation.tick / elapsed:,.0f} ticks/s, {simulation.calls / elapsed:,.0f} calls/s '
+          f'({elapsed:.3f} s)')
+
+
+def run_faults(args):
+    try:
+        build_simulation(args)
+        build_schedule(args)
+        if args.max_failed is not None and not 0 <= args.max_failed <= args.elevators:
+            raise ValueError(f"--max-failed must be between 0 and {args.elevators}")
+    except ValueError as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 2
+
+    # Every row must see the same traffic and random faults, so fix the seed up front
+    if args.seed is None:
+        args.seed = random.randrange(2 ** 32)
+        print(f'seed: {args.seed}')
+    results = degradation(lambda injector: build_simulation(args, injector), args.elevators, args.ticks,
+                          args.max_failed, args.seed, lambda: build_schedule(args))
+    print(f"{'failed':>6}{'mean':>8}{'p50':>6}{'p95':>6}{'p99':>6}{'max':>6}{'in flight':>11}{'waiting':>9}")
+    for result in results:
+        if result['count']:
+            waits = (f"{result['mean']:>8.2f}{result['p50']:>6}{result['p95']:>6}{result['p99']:>6}"
+                     f"{result['max']:>6}")
+        else:
+            waits = f"{'-':>8}{'-':>6}{'-':>6}{'-':>6}{'-':>6}"
+        print(f"{result['failed']:>6}{waits}{result['in_flight']:>11}{result['waiting']:>9}")
+
+    if args.out:
+        for result in results:
+            result.update(benchmark='faults', policy=args.policy, traffic=f"{args.traffic}, {result['failed']} failed",
+                          elevators=args.elevators, floors=args.max_floor - args.min_floor + 1, ticks=args.ticks,
+                          seed=args.seed)
+        with open(args.out, 'w') as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+def run_verify(args):
+    engine = ENGINES[args.engine]
+    if args.no_hypothesis:
+        divergence = fuzz_random(engine, args.examples, args.seed)
+        if divergence is not None:
+            print(divergence, file=sys.stderr)
+            return 1
+    else:
+        try:
+            fuzz(engine, args.examples, args.seed)
+        except ImportError:
+            print("error: verify needs hypothesis (pip install elevator-sim[verify]), "
+                  "or pass --no-hypothesis", file=sys.stderr)
+            return 2
+        except AssertionError as e:
+            print(e, file=sys.stderr)
+            return 1
+    print(f'{args.engine}: {args.examples} scripts match the reference model')
+    return 0
+
+
+def run_report(args):
+    # Imported here so that the simulator itself never loads the report code
+    from .report import write_report
+    try:
+        records = write_report(args.inputs, args.output, args.png, args.recompute)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f'error: {e}', file=sys.stderr)
+        return 2
+    print(f'{len(records)} runs written to {args.output}' + (f' and {args.png}' if args.png else ''))
+    return 0
+
+
+def run_gui(args):
+    # Imported here so that headless runs never load tkinter, graphviz or PIL
+    from .gui import ask_elevator_config
+    ask_elevator_config()
+    return 0
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'run':
+        return run_headless(args)
+    if args.command == 'faults':
+        return run_faults(args)
+    if args.command == 'verify':
+        return run_verify(args)
+    if args.command == 'report':
+        return run_report(args)
+    return run_gui(args)
@@ -0,0 +1,46 @@
+class DemandModel:
+    # Hall-call rate per floor and time-of-day bucket, learnt online. Calls are counted
+    # for the bucket in progress and folded into an exponentially weighted average when
+    # the bucket ends, so memory is buckets x floors however long the run is.
+    def __init__(self, min_floor, max_floor, day_length=2000, buckets=20, smoothing=0.3):
+        self.min_floor = min_floor
+        self.floor_count = max_floor - min_floor + 1
+        self.day_length = day_length
+        self.buckets = buckets
+        self.bucket_length = day_length / buckets
+        self.smoothing = smoothing
+
+        self.rates = [[0.0] * self.floor_count for _ in range(buckets)]
+        self.seen = [False] * buckets
+        self.counts = [0] * self.floor_count
+        self.current_bucket = 0
+        self.current_day = 0
+
+    def bucket(self, tick):
+        return int((tick % self.day_length) / self.bucket_length)
+
+    def observe(self, tick, floor):
+        self.advance(tick)
+        self.counts[floor - self.min_floor] += 1
+
+    def advance(self, tick):
+        day, bucket = divmod(tick, self.day_length)
+        bucket = int(bucket / self.bucket_length)
+        if (day, bucket) != (self.current_day, self.current_bucket):
+            self.fold()
+            self.current_day = day
+            self.current_bucket = bucket
+
+    def fold(self):
+        rates = self.rates[self.current_bucket]
+        alpha = self.smoothing if self.seen[self.current_bucket] else 1.0
+        for i, count in enumerate(self.counts):
+            rates[i] += alpha * (count / self.bucket_length - rates[i])
+            self.counts[i] = 0
+        self.seen[self.current_bucket] = True
+
+    def predict(self, tick):
+        # Calls per tick expected at each floor around tick, busiest floor first
+        rates = self.rates[self.bucket(tick)]
+        ranked = sorted(range(self.floor_count), key=lambda i: -rates[i])
+        return [(i + self.min_floor, rates[i]) for i in ranked]
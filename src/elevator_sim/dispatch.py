@@ -0,0 +1,66 @@
+from .direction import Direction
+
+# Dispatch policies pick which of the available elevators answers a hall call.
+# Each one is called as policy(elevators, floor, direction) and returns an elevator.
+
+
+def least_busy(elevators, floor, direction):
+    return min(elevators, key=lambda e: e.get_destination_count())
+
+
+def nearest(elevators, floor, direction):
+    return min(elevators, key=lambda e: (abs(e.current_floor - floor), e.get_destination_count()))
+
+
+def estimated_wait(elevator, floor, direction):
+    # Floors the car covers before reaching floor when it finishes its current sweep first
+    current = elevator.current_floor
+    destinations = elevator.destinations()
+    if elevator.direction is Direction.STAY or not destinations:
+        return abs(floor - current)
+    if elevator.direction is Direction.UP:
+        top = max(max(destinations), current)
+        if floor >= current and (direction is not Direction.DOWN or floor >= top):
+            return floor - current
+        return (top - current) + (top - floor)
+    bottom = min(min(destinations), current)
+    if floor <= current and (direction is not Direction.UP or floor <= bottom):
+        return current - floor
+    return (current - bottom) + (floor - bottom)
+
+
+def extra_travel(elevator, floor):
+    # Car-floors added to the car's planned route by also stopping at floor
+    destinations = elevator.destinations()
+    lowest = min(min(destinations), elevator.current_floor) if destinations else elevator.current_floor
+    highest = max(max(destinations), elevator.current_floor) if destinations else elevator.current_floor
+    return max(0, floor - highest) + max(0, lowest - floor)
+
+
+class EnergyAwareDispatch:
+    # Accepts up to slack ticks of extra wait over the fastest car if that saves travel
+    def __init__(self, slack=2):
+        if slack < 0:
+            raise ValueError("Energy slack must not be negative")
+        self.slack = slack
+
+    def __call__(self, elevators, floor, direction):
+        waits = [(estimated_wait(e, floor, direction), e) for e in elevators]
+        best_wait = min(wait for wait, _ in waits)
+        candidates = [(extra_travel(e, floor), wait, e.get_destination_count(), e.id, e)
+                      for wait, e in waits if wait <= best_wait + self.slack]
+        return min(candidates)[-1]
+
+
+POLICIES = {
+    'least_busy': least_busy,
+    'nearest': nearest,
+    'energy': EnergyAwareDispatch(),
+}
+
+
+def get_policy(name):
+    try:
+        return POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown dispatch policy {name!r}, choose from {', '.join(POLICIES)}")
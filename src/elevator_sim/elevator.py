@@ -1,4 +1,4 @@
-from direction import Direction
+from .direction import Direction
 
 class Elevator:
     def __init__(self, id):
@@ -9,6 +9,16 @@ class Elevator:
         self.direction = Direction.STAY
         self.open_doors = False
         self.is_emergency = False
+        self.load = 0
+
+        # Travel accounting for the energy model, cheap enough to always stay on
+        self.odometer = 0
+        self.up_floors = 0
+        self.loaded_up_floors = 0
+        self.loaded_down_floors = 0
+        self.reversals = 0
+        self.door_cycles = 0
+        self.last_direction = Direction.STAY
 
     def __str__(self):
         return f'| id: {self.id}, floor: {self.current_floor}, dest: {self.destinations()}, dir: {self.direction.name}' + (', DOOR OPEN |' if self.open_doors else ' |')
@@ -18,17 +28,36 @@ class Elevator:
             self.open_doors = True
             return
         self.open_doors = False
+        if self.direction is not Direction.STAY:
+            self.count_travel()
         self.current_floor += self.direction.value
         self.check_open_doors()
         self.update_direction()
 
+    def count_travel(self):
+        self.odometer += 1
+        if self.direction is Direction.UP:
+            self.up_floors += 1
+            if self.load:
+                self.loaded_up_floors += 1
+        elif self.load:
+            self.loaded_down_floors += 1
+        if self.last_direction is Direction.opposite(self.direction):
+            self.reversals += 1
+        self.last_direction = self.direction
+
     def check_open_doors(self):
         if not self.direction is Direction.UP and self.current_floor in self.down_destinations:
             self.down_destinations.remove(self.current_floor)
-            self.open_doors = True
+            self.open_door()
         if not self.direction is Direction.DOWN and self.current_floor in self.up_destinations:
             self.up_destinations.remove(self.current_floor)
-            self.open_doors = True
+            self.open_door()
+
+    def open_door(self):
+        if not self.open_doors:
+            self.door_cycles += 1
+        self.open_doors = True
 
     def update_direction(self):
         destinations = self.destinations()
@@ -0,0 +1,226 @@
+from .elevator import Elevator
+from .direction import Direction
+from .dispatch import least_busy, estimated_wait
+from .hallcalls import HallCall, HallCallRegistry
+
+BACKENDS = ('python', 'kernel')
+
+
+class ElevatorSystem:
+    def __init__(self, elevator_count=4, dispatch=least_busy, reassign_after=10, backend='python'):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, choose from {', '.join(BACKENDS)}")
+        self.elevators = [Elevator(i) for i in range(elevator_count)]
+        self.dispatch = dispatch
+        self.reassign_after = reassign_after
+        self.backend = backend
+        self.tick = 0
+        self.hall_calls = HallCallRegistry()
+        self.car_calls = [set() for _ in self.elevators]
+        # Elevator id -> ticks per floor for cars running slow
+        self.slowdowns = {}
+
+    def __str__(self):
+        return '\n'.join(map(str, self.elevators))
+
+    def pickup(self, floor, direction_value):
+        direction = Direction.STAY
+        if direction_value > 0:
+            direction = Direction.UP
+        elif direction_value < 0:
+            direction = Direction.DOWN
+
+        if direction is Direction.STAY:
+            available_elevators = self.available_elevators()
+            if not available_elevators:
+                return
+            elevator_pick = self.dispatch(available_elevators, floor, direction)
+            elevator_pick.add_destination(floor, direction)
+            return elevator_pick
+
+        call = self.hall_calls.get(floor, direction)
+        if call is not None:
+            # Someone already pressed this button, the assigned car will serve both
+            call.presses += 1
+            return None if call.elevator_id is None else self.elevators[call.elevator_id]
+
+        call = HallCall(floor, direction, self.tick)
+        self.hall_calls.add(call)
+        return self.assign(call)
+
+    def press(self, elevator_id, floor):
+        # Destination chosen inside the car
+        elevator = self.elevators[elevator_id]
+        if elevator.is_emergency:
+            return
+        if self.open_in_place(elevator, floor):
+            return
+        self.car_calls[elevator_id].add(floor)
+        elevator.add_destination(floor, Direction.UP if floor > elevator.current_floor else Direction.DOWN)
+
+    def available_elevators(self):
+        return [e for e in self.elevators if not e.is_emergency]
+
+    def assign(self, call, available_elevators=None):
+        if available_elevators is None:
+            available_elevators = self.available_elevators()
+        if not available_elevators:
+            # Kept pending until a car is available again
+            return None
+
+        elevator_pick = self.dispatch(available_elevators, call.floor, call.direction)
+        if self.open_in_place(elevator_pick, call.floor, call.direction):
+            self.hall_calls.remove(call)
+            return elevator_pick
+        self.hall_calls.assign(call, elevator_pick.id, self.tick)
+        elevator_pick.add_destination(call.floor, call.direction)
+        return elevator_pick
+
+    def open_in_place(self, elevator, floor, direction=Direction.STAY):
+        # An idle car asked to stop where it stands opens its doors there, instead of
+        # Elevator.update_direction sending it a floor down and back. A car stopped at the
+        # floor on its way in the call's direction takes the call before it leaves.
+        if elevator.current_floor != floor:
+            return False
+        if elevator.direction is Direction.STAY or (elevator.open_doors and elevator.direction is direction):
+            elevator.open_door()
+            return True
+        return False
+
+    def unassign(self, call):
+        # Take a call away from its car, keeping the stop if a rider also asked for it
+        elevator = self.elevators[call.elevator_id]
+        self.hall_calls.unassign(call)
+        if call.floor not in self.car_calls[elevator.id]:
+            stops = elevator.up_destinations if call.direction is Direction.UP else elevator.down_destinations
+            stops.discard(call.floor)
+            elevator.update_direction()
+
+    def set_emergency(self, elevator_id, is_emergency=True):
+        self.set_emergency_many([elevator_id], is_emergency)
+
+    def set_emergency_many(self, elevator_ids, is_emergency=True):
+        # Takes several cars out of (or back into) service at once, handing all of their
+        # hall calls to the remaining cars in a single pass
+        elevators = [self.elevators[i] for i in elevator_ids]
+        for elevator in elevators:
+            elevator.is_emergency = is_emergency
+            if is_emergency:
+                elevator.up_destinations.clear()
+                elevator.down_destinations.clear()
+                elevator.direction = Direction.STAY
+                elevator.open_doors = True
+                self.car_calls[elevator.id].clear()
+        if is_emergency:
+            self.reassign_from(*elevators)
+        else:
+            self.assign_pending()
+
+    def reassign_from(self, *elevators):
+        calls = [call for elevator in elevators for call in self.hall_calls.assigned_to(elevator.id)]
+        for call in calls:
+            self.hall_calls.unassign(call)
+        available_elevators = self.available_elevators()
+        for call in calls:
+            self.assign(call, available_elevators)
+
+    def assign_pending(self):
+        if not self.hall_calls.pending:
+            return
+        available_elevators = self.available_elevators()
+        if available_elevators:
+            for call in self.hall_calls.pending_calls():
+                self.assign(call, available_elevators)
+
+    def rebalance(self):
+        # Hand calls that have waited too long to an idle car that can get there sooner
+        idle = [e for e in self.elevators
+                if not e.is_emergency and e.direction is Direction.STAY and not e.destinations()]
+        relieved = []
+        served = []
+        for call in self.hall_calls:
+            if not idle or call.age(self.tick) < self.reassign_after:
+                break
+            if call.elevator_id is None:
+                continue
+            current = self.elevators[call.elevator_id]
+            best = min(idle, key=lambda e: abs(e.current_floor - call.floor))
+            if abs(best.current_floor - call.floor) < estimated_wait(current, call.floor, call.direction):
+                self.unassign(call)
+                if self.open_in_place(best, call.floor, call.direction):
+                    served.append(call)
+                else:
+                    self.hall_calls.assign(call, best.id, self.tick)
+                    best.add_destination(call.floor, call.direction)
+                idle.remove(best)
+                relieved.append(current)
+        for call in served:
+            self.hall_calls.remove(call)
+
+        # Dropping a stop can make a car settle and open where it stands
+        for elevator in relieved:
+            if elevator.open_doors:
+                self.resolve_calls(elevator)
+
+    def step(self, n_ticks=1):
+        # The kernel backend moves the cars for as many ticks as it can in one call; the
+        # Python backend moves them one tick at a time. Both settle the hall calls in
+        # between, so they end up in the same state.
+        while n_ticks > 0:
+            ticks = self.batch_size(n_ticks)
+            if ticks > 1 and self.kernel_step(ticks):
+                self.tick += ticks
+            else:
+                ticks = 1
+                self.tick += 1
+                if self.slowdowns:
+                    for elevator in self.elevators:
+                        if not self.tick % self.slowdowns.get(elevator.id, 1):
+                            elevator.move()
+                else:
+                    for elevator in self.elevators:
+                        elevator.move()
+            self.update_calls()
+            n_ticks -= ticks
+
+    def batch_size(self, n_ticks):
+        # Ticks the kernel can run without settling the hall calls in between. Between
+        # calls to step only rebalance can act on the cars, and it waits until the oldest
+        # call is reassign_after ticks old; after that the cars go one tick at a time.
+        if self.backend != 'kernel' or self.slowdowns:
+            return 1
+        if self.hall_calls:
+            oldest = next(iter(self.hall_calls))
+            n_ticks = min(n_ticks, oldest.created + self.reassign_after - self.tick - 1)
+        return n_ticks
+
+    def kernel_step(self, n_ticks):
+        # Imported on first use so that loading Numba never slows down the Python backend
+        from . import kernel
+        return kernel.step_elevators(self.elevators, n_ticks)
+
+    def update_calls(self):
+        for elevator in self.elevators:
+            if elevator.is_emergency:
+                if self.hall_calls.by_elevator.get(elevator.id):
+                    self.reassign_from(elevator)
+            else:
+                self.resolve_calls(elevator)
+
+        self.assign_pending()
+        if self.hall_calls:
+            self.rebalance()
+
+    def resolve_calls(self, elevator):
+        # A stop only leaves a car's destinations when it opens there, so any call whose
+        # floor is gone from its car's stops has been served
+        car_calls = self.car_calls[elevator.id]
+        if car_calls:
+            car_calls.intersection_update(elevator.up_destinations | elevator.down_destinations)
+        for call in self.hall_calls.assigned_to(elevator.id):
+            stops = elevator.up_destinations if call.direction is Direction.UP else elevator.down_destinations
+            if call.floor not in stops:
+                self.hall_calls.remove(call)
+
+    def get_status(self):
+        return [elevator.get_status() for elevator in self.elevators]
@@ -0,0 +1,24 @@
+# Energy cost per floor travelled for a counterweighted car. The counterweight balances
+# a partly loaded car, so an empty car is cheap going up and costs more going down,
+# while a loaded car is the other way round. The costs are relative weights for comparing
+# runs and policies, not a calibrated physical unit.
+
+
+class EnergyModel:
+    def __init__(self, up_empty=0.02, up_loaded=0.05, down_empty=0.04, down_loaded=0.01, door_cycle=0.005):
+        self.up_empty = up_empty
+        self.up_loaded = up_loaded
+        self.down_empty = down_empty
+        self.down_loaded = down_loaded
+        self.door_cycle = door_cycle
+
+    def energy(self, elevator):
+        down_floors = elevator.odometer - elevator.up_floors
+        return (self.up_empty * (elevator.up_floors - elevator.loaded_up_floors)
+                + self.up_loaded * elevator.loaded_up_floors
+                + self.down_empty * (down_floors - elevator.loaded_down_floors)
+                + self.down_loaded * elevator.loaded_down_floors
+                + self.door_cycle * elevator.door_cycles)
+
+    def total_energy(self, elevators):
+        return sum(self.energy(elevator) for elevator in elevators)
@@ -0,0 +1,232 @@
+import random
+
+from .direction import Direction
+from .elevatorsystem import ElevatorSystem
+
+# Differential testing for alternative engines. An engine exposes
+#
+#   add_destination(elevator_id, floor, direction)
+#   pickup(floor, direction)
+#   set_emergency(elevator_id, is_emergency)
+#   set_load(elevator_id, load)
+#   step(n_ticks)
+#   state() -> one tuple of STATE_FIELDS per car
+#
+# and a script of operations is replayed on the reference model and the candidate side
+# by side, comparing every car after every step. Hall calls go through
+# ElevatorSystem.pickup, so dispatch, the call registry and rebalancing run too.
+# When a batched step diverges, it is replayed tick by tick to find the first tick
+# that differs.
+
+STATE_FIELDS = ('floor', 'direction', 'open_doors', 'emergency', 'up_destinations', 'down_destinations',
+                'odometer', 'up_floors', 'loaded_up_floors', 'loaded_down_floors', 'reversals', 'door_cycles')
+
+
+def elevator_state(elevator):
+    return (elevator.current_floor, elevator.direction.value, elevator.open_doors, elevator.is_emergency,
+            tuple(sorted(elevator.up_destinations)), tuple(sorted(elevator.down_destinations)),
+            elevator.odometer, elevator.up_floors, elevator.loaded_up_floors, elevator.loaded_down_floors,
+            elevator.reversals, elevator.door_cycles)
+
+
+class ReferenceEngine:
+    # The plain Python model: Elevator.move for every car, one tick at a time
+    backend = 'python'
+
+    def __init__(self, elevator_count):
+        self.system = ElevatorSystem(elevator_count, backend=self.backend)
+
+    def add_destination(self, elevator_id, floor, direction):
+        self.system.elevators[elevator_id].add_destination(floor, direction)
+
+    def pickup(self, floor, direction):
+        self.system.pickup(floor, direction)
+
+    def set_emergency(self, elevator_id, is_emergency):
+        self.system.set_emergency(elevator_id, is_emergency)
+
+    def set_load(self, elevator_id, load):
+        self.system.elevators[elevator_id].load = load
+
+    def step(self, n_ticks=1):
+        for _ in range(n_ticks):
+            self.system.step()
+
+    def state(self):
+        return [elevator_state(elevator) for elevator in self.system.elevators]
+
+
+class KernelEngine(ReferenceEngine):
+    # ElevatorSystem on the flat-array kernel, batched steps in a single kernel call
+    backend = 'kernel'
+
+    def step(self, n_ticks=1):
+        self.system.step(n_ticks)
+
+
+ENGINES = {
+    'reference': ReferenceEngine,
+    'kernel': KernelEngine,
+}
+
+
+class Divergence:
+    # script is the prefix of the original script that reproduces it, ending with the
+    # diverging operation (a batched step cut down to the first tick that differs)
+    def __init__(self, engine_name, elevator_count, script, tick, elevator_id, field, expected, actual):
+        self.engine_name = engine_name
+        self.elevator_count = elevator_count
+        self.script = script
+        self.index = len(script) - 1
+        self.operation = script[-1]
+        self.tick = tick
+        self.elevator_id = elevator_id
+        self.field = field
+        self.expected = expected
+        self.actual = actual
+
+    def __str__(self):
+        return (f'engines diverge after operation {self.index} {self.operation!r} (tick {self.tick}): '
+                f'elevator {self.elevator_id} {self.field} is {self.actual!r}, expected {self.expected!r}\n'
+                f'reproduce with: check_equivalence({self.engine_name}, {self.elevator_count}, {self.script!r})')
+
+
+def compare_states(expected, actual):
+    if len(expected) != len(actual):
+        return None, 'elevator count', len(expected), len(actual)
+    for elevator_id, (want, got) in enumerate(zip(expected, actual)):
+        for field, a, b in zip(STATE_FIELDS, want, got):
+            if a != b:
+                return elevator_id, field, a, b
+    return None
+
+
+def apply(engine, operation):
+    name, *args = operation
+    if name == 'add':
+        elevator_id, floor, direction = args
+        engine.add_destination(elevator_id, floor, Direction(direction))
+    elif name == 'pickup':
+        engine.pickup(*args)
+    elif name == 'emergency':
+        engine.set_emergency(*args)
+    elif name == 'load':
+        engine.set_load(*args)
+    elif name == 'step':
+        engine.step(*args)
+    else:
+        raise ValueError(f'Unknown operation {name!r}')
+
+
+def replay(engine_factory, reference_factory, elevator_count, script):
+    reference = reference_factory(elevator_count)
+    candidate = engine_factory(elevator_count)
+    for operation in script:
+        apply(reference, operation)
+        apply(candidate, operation)
+    return reference, candidate
+
+
+def find_divergence(engine_factory, elevator_count, script, reference_factory=ReferenceEngine):
+    # Replays script on both engines and returns the first Divergence, or None if they agree
+    reference, candidate = replay(engine_factory, reference_factory, elevator_count, [])
+    tick = 0
+    for index, operation in enumerate(script):
+        apply(reference, operation)
+        apply(candidate, operation)
+        difference = compare_states(reference.state(), candidate.state())
+        prefix = script[:index]
+        if difference is not None and operation[0] == 'step' and operation[1] > 1:
+            # The candidate may run the batch in one go, so step fresh engines 1, 2, ...
+            # ticks past the prefix to find how far into the batch they first differ
+            for n_ticks in range(1, operation[1] + 1):
+                reference, candidate = replay(engine_factory, reference_factory, elevator_count,
+                                              prefix + [('step', n_ticks)])
+                difference = compare_states(reference.state(), candidate.state())
+                if difference is not None:
+                    operation = ('step', n_ticks)
+                    break
+        if operation[0] == 'step':
+            tick += operation[1]
+        if difference is not None:
+            engine_name = getattr(engine_factory, '__name__', repr(engine_factory))
+            return Divergence(engine_name, elevator_count, prefix + [operation], tick, *difference)
+    return None
+
+
+def check_equivalence(engine_factory, elevator_count, script, reference_factory=ReferenceEngine):
+    divergence = find_divergence(engine_factory, elevator_count, script, reference_factory)
+    if divergence is not None:
+        raise AssertionError(str(divergence))
+
+
+def random_script(rng, elevator_count, min_floor=0, max_floor=9, length=200):
+    # Randomized traffic without Hypothesis: mostly calls and single steps, some batches
+    script = []
+    for _ in range(length):
+        draw = rng.random()
+        if draw < 0.25:
+            script.append(('add', rng.randrange(elevator_count), rng.randint(min_floor, max_floor),
+                           rng.choice((1, -1))))
+        elif draw < 0.45:
+            script.append(('pickup', rng.randint(min_floor, max_floor), rng.choice((1, -1))))
+        elif draw < 0.5:
+            script.append(('emergency', rng.randrange(elevator_count), rng.random() < 0.5))
+        elif draw < 0.55:
+            script.append(('load', rng.randrange(elevator_count), rng.randint(0, 3)))
+        else:
+            script.append(('step', 1 if rng.random() < 0.8 else rng.randint(2, 20)))
+    return script
+
+
+def scripts(max_elevators=6, max_span=20):
+    # Hypothesis strategy drawing (elevator_count, script) pairs
+    from hypothesis import strategies as st
+
+    @st.composite
+    def build(draw):
+        elevator_count = draw(st.integers(1, max_elevators))
+        min_floor = draw(st.integers(-3, 3))
+        max_floor = min_floor + draw(st.integers(1, max_span))
+        elevators = st.integers(0, elevator_count - 1)
+        floors = st.integers(min_floor, max_floor)
+        directions = st.sampled_from((1, -1))
+        operation = st.one_of(
+            st.tuples(st.just('add'), elevators, floors, directions),
+            st.tuples(st.just('pickup'), floors, directions),
+            st.tuples(st.just('emergency'), elevators, st.booleans()),
+            st.tuples(st.just('load'), elevators, st.integers(0, 3)),
+            st.tuples(st.just('step'), st.integers(1, 20)),
+        )
+        return elevator_count, draw(st.lists(operation, max_size=300))
+
+    return build()
+
+
+def fuzz(engine_factory, max_examples=200, seed=None):
+    # Hypothesis shrinks a failing script to a minimal one before the divergence is raised
+    from hypothesis import given, settings, seed as hypothesis_seed
+
+    @settings(max_examples=max_examples, deadline=None, database=None)
+    @given(scripts())
+    def run(case):
+        elevator_count, script = case
+        check_equivalence(engine_factory, elevator_count, script)
+
+    if seed is not None:
+        run = hypothesis_seed(seed)(run)
+    run()
+
+
+def fuzz_random(engine_factory, runs=200, seed=None):
+    # Same check driven by the random module, for environments without Hypothesis
+    rng = random.Random(seed)
+    for _ in range(runs):
+        elevator_count = rng.randint(1, 6)
+        min_floor = rng.randint(-3, 3)
+        max_floor = min_floor + rng.randint(1, 20)
+        script = random_script(rng, elevator_count, min_floor, max_floor)
+        divergence = find_divergence(engine_factory, elevator_count, script)
+        if divergence is not None:
+            return divergence
+    return None
@@ -0,0 +1,142 @@
+import heapq
+import random
+
+from .metrics import WaitStats
+
+# Faults take a car out of service for a while (outage, maintenance, door fault) or make
+# it run slower. They are scheduled up front as start/end events on a heap, so each tick
+# only peeks at the next event instead of checking every car.
+
+OUTAGE = 'outage'
+MAINTENANCE = 'maintenance'
+DOOR_FAULT = 'door_fault'
+SLOWDOWN = 'slowdown'
+OUT_OF_SERVICE = (OUTAGE, MAINTENANCE, DOOR_FAULT)
+KINDS = OUT_OF_SERVICE + (SLOWDOWN,)
+
+
+class FaultSchedule:
+    def __init__(self):
+        self.events = []
+        self.count = 0
+
+    def __len__(self):
+        return len(self.events)
+
+    def add(self, kind, elevator_id, start, duration):
+        if kind not in KINDS:
+            raise ValueError(f"Unknown fault {kind!r}, choose from {', '.join(KINDS)}")
+        # count keeps events at the same tick in insertion order
+        heapq.heappush(self.events, (start, self.count, kind, elevator_id, True))
+        heapq.heappush(self.events, (start + max(1, duration), self.count, kind, elevator_id, False))
+        self.count += 1
+
+    def add_random(self, rng, kind, elevator_count, ticks, rate, mean_duration):
+        # Poisson faults at rate per car per tick, exponentially distributed durations
+        if rate <= 0:
+            return
+        for elevator_id in range(elevator_count):
+            tick = rng.expovariate(rate)
+            while tick < ticks:
+                self.add(kind, elevator_id, int(tick), round(rng.expovariate(1 / mean_duration)))
+                tick += rng.expovariate(rate)
+
+    def due(self, tick):
+        while self.events and self.events[0][0] <= tick:
+            yield heapq.heappop(self.events)
+
+
+class FaultInjector:
+    def __init__(self, schedule, slowdown_factor=2):
+        self.schedule = schedule
+        self.slowdown_factor = slowdown_factor
+        self.out_of_service = {}
+        self.slowed = {}
+        self.started = dict.fromkeys(KINDS, 0)
+        self.out_of_service_ticks = 0
+
+    def apply(self, simulation):
+        # Returns True when a car went out of or came back into service
+        system = simulation.system
+        tick = simulation.tick
+        self.out_of_service_ticks += len(self.out_of_service)
+        if not self.schedule.events or self.schedule.events[0][0] > tick:
+            return False
+
+        changed = set()
+        for _, _, kind, elevator_id, starting in self.schedule.due(tick):
+            if kind == SLOWDOWN:
+                self.count(self.slowed, elevator_id, starting)
+                if elevator_id in self.slowed:
+                    system.slowdowns[elevator_id] = self.slowdown_factor
+                else:
+                    system.slowdowns.pop(elevator_id, None)
+            else:
+                changed.add(elevator_id)
+                self.count(self.out_of_service, elevator_id, starting)
+            if starting:
+                self.started[kind] += 1
+
+        failed = [i for i in changed if i in self.out_of_service and not system.elevators[i].is_emergency]
+        restored = [i for i in changed if i not in self.out_of_service and system.elevators[i].is_emergency]
+        if failed:
+            system.set_emergency_many(failed, True)
+        if restored:
+            system.set_emergency_many(restored, False)
+            simulation.repress(restored)
+        return bool(failed or restored)
+
+    def count(self, active, elevator_id, starting):
+        # Faults on the same car can overlap, the car is only back once all have ended
+        active[elevator_id] = active.get(elevator_id, 0) + (1 if starting else -1)
+        if not active[elevator_id]:
+            del active[elevator_id]
+
+    def summary(self):
+        return dict(faults=dict(self.started), out_of_service_ticks=self.out_of_service_ticks)
+
+
+def random_schedule(rng, elevator_count, ticks, outage_rate=0.0, door_fault_rate=0.0, slowdown_rate=0.0,
+                    mean_duration=200):
+    schedule = FaultSchedule()
+    schedule.add_random(rng, OUTAGE, elevator_count, ticks, outage_rate, mean_duration)
+    schedule.add_random(rng, DOOR_FAULT, elevator_count, ticks, door_fault_rate, mean_duration / 4)
+    schedule.add_random(rng, SLOWDOWN, elevator_count, ticks, slowdown_rate, mean_duration)
+    return schedule
+
+
+def degradation(make_simulation, elevator_count, ticks, max_failed=None, seed=None, make_schedule=None):
+    # Wait-time percentiles with 0, 1, 2, ... cars out of service for the whole run, on
+    # the same traffic. make_schedule can add random faults on top of the failed cars.
+    # The percentiles are None when nobody arrived at all.
+    rng = random.Random(seed)
+    if max_failed is None:
+        max_failed = elevator_count - 1
+    results = []
+    for failed in range(max_failed + 1):
+        schedule = make_schedule() if make_schedule else FaultSchedule()
+        for elevator_id in rng.sample(range(elevator_count), failed):
+            schedule.add(OUTAGE, elevator_id, 0, ticks + 1)
+        injector = FaultInjector(schedule)
+        simulation = make_simulation(injector)
+
+        waits = WaitStats()
+        for _ in range(ticks):
+            for passenger in simulation.step():
+                waits.add(passenger.board_tick - passenger.arrival_tick)
+        # Passengers still in the building count too, the ones still waiting with their
+        # wait so far, so that a total outage shows up as long waits instead of none
+        for riders in simulation.riding:
+            for passenger in riders:
+                waits.add(passenger.board_tick - passenger.arrival_tick)
+        waiting = 0
+        for passengers in simulation.waiting.values():
+            waiting += len(passengers)
+            for passenger in passengers:
+                waits.add(simulation.tick - passenger.arrival_tick)
+        summary = waits.summary()
+        if not waits.count:
+            summary = dict(dict.fromkeys(summary), count=0)
+        results.append(dict(failed=failed, in_flight=simulation.in_flight(), waiting=waiting,
+                            **injector.summary(), **summary))
+    return results
@@ -0,0 +1,67 @@
+class HallCall:
+    __slots__ = ('floor', 'direction', 'elevator_id', 'created', 'assigned', 'presses')
+
+    def __init__(self, floor, direction, created):
+        self.floor = floor
+        self.direction = direction
+        self.elevator_id = None
+        self.created = created
+        self.assigned = None
+        self.presses = 1
+
+    def __repr__(self):
+        return f'HallCall(floor={self.floor}, direction={self.direction.name}, elevator={self.elevator_id})'
+
+    def key(self):
+        return self.floor, self.direction
+
+    def age(self, tick):
+        return tick - self.created
+
+
+class HallCallRegistry:
+    # One call per (floor, direction). Calls are kept in creation order, so the oldest
+    # ones come first, and indexed by elevator and by pending state for O(1) lookups.
+    def __init__(self):
+        self.calls = {}
+        self.by_elevator = {}
+        self.pending = {}
+
+    def __len__(self):
+        return len(self.calls)
+
+    def __iter__(self):
+        # Oldest call first; don't add or remove calls while iterating
+        return iter(self.calls.values())
+
+    def get(self, floor, direction):
+        return self.calls.get((floor, direction))
+
+    def add(self, call):
+        self.calls[call.key()] = call
+        self.pending[call.key()] = call
+
+    def assign(self, call, elevator_id, tick):
+        self.unassign(call)
+        del self.pending[call.key()]
+        call.elevator_id = elevator_id
+        call.assigned = tick
+        self.by_elevator.setdefault(elevator_id, set()).add(call.key())
+
+    def unassign(self, call):
+        if call.elevator_id is not None:
+            self.by_elevator[call.elevator_id].discard(call.key())
+            call.elevator_id = None
+            call.assigned = None
+            self.pending[call.key()] = call
+
+    def remove(self, call):
+        self.unassign(call)
+        del self.pending[call.key()]
+        del self.calls[call.key()]
+
+    def assigned_to(self, elevator_id):
+        return [self.calls[key] for key in self.by_elevator.get(elevator_id, ())]
+
+    def pending_calls(self):
+        return list(self.pending.values())
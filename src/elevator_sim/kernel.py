@@ -0,0 +1,189 @@
+from .direction import Direction
+
+# The SCAN state machine of Elevator.move over flat per-car arrays, advancing every car
+# for many ticks in one call. Destinations are bit masks relative to a per-car offset
+# floor, so each car's stops can span at most MAX_SPAN floors. The kernel is compiled
+# with Numba when it is installed and runs as plain Python otherwise.
+
+try:
+    import numba
+    import numpy
+except ImportError:
+    numba = None
+    numpy = None
+
+HAVE_NUMBA = numba is not None
+MAX_SPAN = 62
+
+# Per-car integer fields, in the order the kernel takes them
+FIELDS = ('offset', 'floor', 'direction', 'open_doors', 'emergency', 'load', 'up', 'down', 'odometer', 'up_floors',
+          'loaded_up_floors', 'loaded_down_floors', 'reversals', 'door_cycles', 'last_direction')
+
+
+def highest_bit(mask):
+    return mask.bit_length() - 1
+
+
+def lowest_bit(mask):
+    return (mask & -mask).bit_length() - 1
+
+
+if HAVE_NUMBA:
+    @numba.njit(cache=True)
+    def highest_bit(mask):
+        bit = -1
+        while mask:
+            mask >>= 1
+            bit += 1
+        return bit
+
+    @numba.njit(cache=True)
+    def lowest_bit(mask):
+        bit = 0
+        while not mask & 1:
+            mask >>= 1
+            bit += 1
+        return bit
+
+
+def check_open_doors(i, offset, floor, direction, open_doors, up, down, door_cycles):
+    position = floor[i] - offset[i]
+    if position < 0 or position > MAX_SPAN:
+        return
+    bit = 1 << position
+    if direction[i] != 1 and down[i] & bit:
+        down[i] &= ~bit
+        if not open_doors[i]:
+            door_cycles[i] += 1
+        open_doors[i] = 1
+    if direction[i] != -1 and up[i] & bit:
+        up[i] &= ~bit
+        if not open_doors[i]:
+            door_cycles[i] += 1
+        open_doors[i] = 1
+
+
+def advance(n_ticks, offset, floor, direction, open_doors, emergency, load, up, down, odometer, up_floors,
+            loaded_up_floors, loaded_down_floors, reversals, door_cycles, last_direction):
+    for _ in range(n_ticks):
+        for i in range(len(floor)):
+            if emergency[i]:
+                open_doors[i] = 1
+                continue
+            open_doors[i] = 0
+
+            moving = direction[i]
+            if moving != 0:
+                odometer[i] += 1
+                if moving == 1:
+                    up_floors[i] += 1
+                    if load[i]:
+                        loaded_up_floors[i] += 1
+                elif load[i]:
+                    loaded_down_floors[i] += 1
+                if last_direction[i] == -moving:
+                    reversals[i] += 1
+                last_direction[i] = moving
+            floor[i] += moving
+
+            check_open_doors(i, offset, floor, direction, open_doors, up, down, door_cycles)
+
+            # update_direction
+            destinations = up[i] | down[i]
+            if destinations:
+                highest = highest_bit(destinations) + offset[i]
+                lowest = lowest_bit(destinations) + offset[i]
+                if direction[i] == 1 and highest == floor[i]:
+                    direction[i] = 0
+                    check_open_doors(i, offset, floor, direction, open_doors, up, down, door_cycles)
+                elif direction[i] == -1 and lowest == floor[i]:
+                    direction[i] = 0
+                    check_open_doors(i, offset, floor, direction, open_doors, up, down, door_cycles)
+                elif direction[i] == -1:
+                    if lowest >= floor[i]:
+                        direction[i] = 1
+                elif direction[i] == 1:
+                    if highest <= floor[i]:
+                        direction[i] = -1
+                elif highest > floor[i]:
+                    direction[i] = 1
+                else:
+                    direction[i] = -1
+            else:
+                direction[i] = 0
+
+
+if HAVE_NUMBA:
+    check_open_doors = numba.njit(cache=True)(check_open_doors)
+    advance = numba.njit(cache=True)(advance)
+
+
+def to_mask(floors, offset):
+    mask = 0
+    for floor in floors:
+        mask |= 1 << (floor - offset)
+    return mask
+
+
+def from_mask(mask, offset):
+    floors = set()
+    while mask:
+        floors.add((mask & -mask).bit_length() - 1 + offset)
+        mask &= mask - 1
+    return floors
+
+
+def destination_offsets(elevators):
+    # Lowest destination floor of each car, or None when a car's stops don't fit in a mask
+    offsets = []
+    for elevator in elevators:
+        floors = elevator.destinations()
+        offset = min(floors) if floors else elevator.current_floor
+        if floors and max(floors) - offset > MAX_SPAN:
+            return None
+        offsets.append(offset)
+    return offsets
+
+
+def pack(elevators, offsets):
+    columns = [[] for _ in FIELDS]
+    for e, offset in zip(elevators, offsets):
+        values = (offset, e.current_floor, e.direction.value, int(e.open_doors), int(e.is_emergency), e.load,
+                  to_mask(e.up_destinations, offset), to_mask(e.down_destinations, offset), e.odometer,
+                  e.up_floors, e.loaded_up_floors, e.loaded_down_floors, e.reversals, e.door_cycles,
+                  e.last_direction.value)
+        for column, value in zip(columns, values):
+            column.append(value)
+    if HAVE_NUMBA:
+        return [numpy.array(column, dtype=numpy.int64) for column in columns]
+    return columns
+
+
+def unpack(elevators, columns):
+    (offset, floor, direction, open_doors, _, _, up, down, odometer, up_floors, loaded_up_floors, loaded_down_floors,
+     reversals, door_cycles, last_direction) = columns
+    for i, e in enumerate(elevators):
+        e.current_floor = int(floor[i])
+        e.direction = Direction(int(direction[i]))
+        e.open_doors = bool(open_doors[i])
+        e.up_destinations = from_mask(int(up[i]), int(offset[i]))
+        e.down_destinations = from_mask(int(down[i]), int(offset[i]))
+        e.odometer = int(odometer[i])
+        e.up_floors = int(up_floors[i])
+        e.loaded_up_floors = int(loaded_up_floors[i])
+        e.loaded_down_floors = int(loaded_down_floors[i])
+        e.reversals = int(reversals[i])
+        e.door_cycles = int(door_cycles[i])
+        e.last_direction = Direction(int(last_direction[i]))
+
+
+def step_elevators(elevators, n_ticks):
+    # Advances the cars n_ticks in one kernel call. Returns False, without touching the
+    # cars, if one car's destinations span more floors than a mask holds.
+    offsets = destination_offsets(elevators)
+    if offsets is None:
+        return False
+    columns = pack(elevators, offsets)
+    advance(n_ticks, *columns)
+    unpack(elevators, columns)
+    return True
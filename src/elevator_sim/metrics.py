@@ -0,0 +1,31 @@
+class WaitStats:
+    # Waits are whole ticks, so a histogram gives exact percentiles in memory bounded
+    # by the longest wait rather than by the number of passengers.
+    def __init__(self):
+        self.histogram = {}
+        self.count = 0
+        self.total = 0
+
+    def add(self, wait):
+        self.histogram[wait] = self.histogram.get(wait, 0) + 1
+        self.count += 1
+        self.total += wait
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        if not self.count:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for wait in sorted(self.histogram):
+            seen += self.histogram[wait]
+            if seen >= rank:
+                return wait
+        return max(self.histogram)
+
+    def summary(self):
+        return {'count': self.count, 'mean': self.mean(), 'p5': self.percentile(5), 'p25': self.percentile(25),
+                'p50': self.percentile(50), 'p75': self.percentile(75), 'p95': self.percentile(95),
+                'p99': self.percentile(99), 'max': self.percentile(100)}
@@ -0,0 +1,107 @@
+import abc
+import csv
+import os
+
+# Sinks buffer rows and flush them to disk every chunk_size rows, so memory use stays
+# constant no matter how long the run is.
+
+
+class BufferedSink(abc.ABC):
+    def __init__(self, fields, chunk_size=10000):
+        self.fields = fields
+        self.chunk_size = chunk_size
+        self.rows = []
+
+    def write(self, row):
+        self.rows.append(row)
+        if len(self.rows) >= self.chunk_size:
+            self.flush()
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    @abc.abstractmethod
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CsvSink(BufferedSink):
+    def __init__(self, path, fields, chunk_size=10000):
+        super().__init__(fields, chunk_size)
+        self.file = open(path, 'w', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(fields)
+
+    def flush(self):
+        self.writer.writerows(self.rows)
+        self.rows.clear()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+
+class ParquetSink(BufferedSink):
+    def __init__(self, path, fields, chunk_size=10000):
+        super().__init__(fields, chunk_size)
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Parquet output needs pyarrow, install it with: pip install elevator-sim[parquet]")
+        self.pyarrow = pyarrow
+        self.path = path
+        self.writer = None
+
+    def flush(self):
+        if not self.rows:
+            return
+        columns = list(zip(*self.rows))
+        table = self.pyarrow.table({field: list(column) for field, column in zip(self.fields, columns)})
+        if self.writer is None:
+            self.writer = self.pyarrow.parquet.ParquetWriter(self.path, table.schema)
+        self.writer.write_table(table)
+        self.rows.clear()
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+
+
+class NullSink:
+    def write(self, row):
+        pass
+
+    def write_many(self, rows):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+SINKS = {'csv': CsvSink, 'parquet': ParquetSink}
+
+
+def open_sink(path, fields, format=None, chunk_size=10000):
+    if path is None:
+        return NullSink()
+    if format is None:
+        format = 'parquet' if os.path.splitext(path)[1] in ('.parquet', '.pq') else 'csv'
+    return SINKS[format](path, fields, chunk_size)
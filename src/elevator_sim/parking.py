@@ -0,0 +1,44 @@
+from .demand import DemandModel
+from .direction import Direction
+
+
+class ParkingStrategy:
+    # Sends idle cars to the floors where the demand model expects the next hall calls,
+    # looking lookahead ticks ahead so that cars are in place before a peak starts.
+    def __init__(self, min_floor, max_floor, day_length=2000, buckets=20, lookahead=50, interval=5,
+                 min_rate=0.002):
+        self.demand = DemandModel(min_floor, max_floor, day_length, buckets)
+        self.lookahead = lookahead
+        self.interval = interval
+        self.min_rate = min_rate
+        self.parked = {}
+
+    def observe(self, tick, floor):
+        self.demand.observe(tick, floor)
+
+    def step(self, tick, elevators):
+        if tick % self.interval:
+            return
+        self.demand.advance(tick)
+
+        idle = [e for e in elevators
+                if not e.is_emergency and e.direction is Direction.STAY and not e.destinations()]
+        if not idle:
+            return
+
+        targets = [floor for floor, rate in self.demand.predict(tick + self.lookahead) if rate >= self.min_rate]
+        covered = {e.current_floor for e in elevators if e.direction is Direction.STAY and not e.is_emergency}
+        self.parked = {eid: floor for eid, floor in self.parked.items() if floor in elevators[eid].destinations()}
+        covered.update(self.parked.values())
+        idle = [e for e in idle if e.current_floor not in targets[:len(idle)]]
+
+        for floor in targets:
+            if not idle:
+                break
+            if floor in covered:
+                continue
+            car = min(idle, key=lambda e: abs(e.current_floor - floor))
+            idle.remove(car)
+            car.add_destination(floor, Direction.UP if floor > car.current_floor else Direction.DOWN)
+            self.parked[car.id] = floor
+            covered.add(floor)
@@ -0,0 +1,222 @@
+import csv
+import html
+import json
+import os
+
+from . import theme
+from .metrics import WaitStats
+
+# Static comparison report for many runs. Inputs are the JSON written by
+# `elevator-sim run --metrics-out` and by the benchmarks (a list of such records).
+# When a record lacks wait percentiles or utilization they are computed from its
+# trace files, which are streamed in chunks (Parquet is memory-mapped).
+
+WAIT_KEYS = ('mean', 'p5', 'p25', 'p50', 'p75', 'p95')
+ROW_HEIGHT = 26
+LABEL_WIDTH = 300
+PLOT_WIDTH = 460
+
+
+def iter_rows(path, columns, chunk_size=65536):
+    if os.path.splitext(path)[1] in ('.parquet', '.pq'):
+        try:
+            import pyarrow.parquet
+        except ImportError:
+            raise RuntimeError("Reading Parquet traces needs pyarrow, install it with: "
+                               "pip install elevator-sim[parquet]")
+        parquet_file = pyarrow.parquet.ParquetFile(path, memory_map=True)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=list(columns)):
+            yield from zip(*(batch.column(name).to_pylist() for name in columns))
+        return
+    with open(path, newline='', buffering=chunk_size) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        indexes = [header.index(name) for name in columns]
+        for row in reader:
+            yield tuple(row[i] for i in indexes)
+
+
+def wait_stats(passengers_file):
+    waits = WaitStats()
+    for wait, in iter_rows(passengers_file, ('wait',)):
+        waits.add(int(wait))
+    return waits
+
+
+def utilization(status_file):
+    # Same rule as Simulation.utilization: cars out of service are left out
+    car_ticks = busy = 0
+    for direction, open_doors, emergency in iter_rows(status_file, ('direction', 'open_doors', 'emergency')):
+        if emergency in (True, 'True'):
+            continue
+        car_ticks += 1
+        if direction != 'STAY' or open_doors in (True, 'True'):
+            busy += 1
+    return busy / car_ticks if car_ticks else 0.0
+
+
+def has_waits(record):
+    # Runs where nobody arrived have no percentiles, or None for each of them
+    return all(record.get(key) is not None for key in WAIT_KEYS)
+
+
+def load_records(paths, recompute=False):
+    records = []
+    for path in paths:
+        with open(path) as f:
+            data = json.load(f)
+        for record in data if isinstance(data, list) else [data]:
+            passengers_file = record.get('passengers_file')
+            if passengers_file and (recompute or not has_waits(record)):
+                record.update(wait_stats(passengers_file).summary())
+            status_file = record.get('status_file')
+            if status_file and (recompute or 'utilization' not in record):
+                record['utilization'] = utilization(status_file)
+            record['label'] = label(record)
+            records.append(record)
+    records.sort(key=lambda r: (r.get('floors', 0), r.get('elevators', 0), r['label']))
+    return records
+
+
+def label(record):
+    text = record.get('policy') or f"{record.get('backend', '?')} backend"
+    if record.get('parking'):
+        text += ' + parking'
+    text += f" / {record.get('traffic', '?')}"
+    return f"{text} / {record.get('floors', '?')} floors x {record.get('elevators', '?')} cars"
+
+
+def svg_text(x, y, text, anchor='start', size=12, color=theme.TEXT_COLOR):
+    return (f'<text x="{x}" y="{y}" text-anchor="{anchor}" font-size="{size}" fill="{color}">'
+            f'{html.escape(str(text))}</text>')
+
+
+def wait_chart(records):
+    # Box from p25 to p75, whiskers to p5 and p95, a tick at the median and a dot at the mean
+    records = [r for r in records if has_waits(r)]
+    if not records:
+        return '<p>No wait-time data.</p>'
+    top = max(r['p95'] for r in records) or 1
+    scale = PLOT_WIDTH / (top * 1.1)
+    height = ROW_HEIGHT * len(records) + 30
+    x = lambda value: LABEL_WIDTH + value * scale
+    parts = [f'<svg width="{LABEL_WIDTH + PLOT_WIDTH + 20}" height="{height}">']
+    for i, r in enumerate(records):
+        y = i * ROW_HEIGHT + 15
+        parts.append(svg_text(LABEL_WIDTH - 10, y + 4, r['label'], anchor='end'))
+        parts.append(f'<line x1="{x(r["p5"]):.1f}" y1="{y}" x2="{x(r["p95"]):.1f}" y2="{y}" '
+                     f'stroke="{theme.SECONDARY_COLOR}"/>')
+        parts.append(f'<rect x="{x(r["p25"]):.1f}" y="{y - 7}" width="{max(x(r["p75"]) - x(r["p25"]), 1):.1f}" '
+                     f'height="14" fill="{theme.PRIMARY_COLOR}" stroke="{theme.BORDER_COLOR}"/>')
+        parts.append(f'<line x1="{x(r["p50"]):.1f}" y1="{y - 7}" x2="{x(r["p50"]):.1f}" y2="{y + 7}" '
+                     f'stroke="{theme.CARD_COLOR}" stroke-width="2"/>')
+        parts.append(f'<circle cx="{x(r["mean"]):.1f}" cy="{y}" r="4" fill="{theme.WARNING_COLOR}"/>')
+    axis_y = height - 12
+    for tick in range(0, int(top * 1.1) + 1, max(1, int(top * 1.1) // 8)):
+        parts.append(svg_text(LABEL_WIDTH + tick * scale, axis_y, tick, anchor='middle', size=10,
+                              color=theme.SECONDARY_COLOR))
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def bar_chart(records, key, fmt, color):
+    records = [r for r in records if r.get(key) is not None]
+    if not records:
+        return f'<p>No {key} data.</p>'
+    top = max(r[key] for r in records) or 1
+    height = ROW_HEIGHT * len(records) + 10
+    parts = [f'<svg width="{LABEL_WIDTH + PLOT_WIDTH + 100}" height="{height}">']
+    for i, r in enumerate(records):
+        y = i * ROW_HEIGHT + 15
+        width = PLOT_WIDTH * r[key] / top
+        parts.append(svg_text(LABEL_WIDTH - 10, y + 4, r['label'], anchor='end'))
+        parts.append(f'<rect x="{LABEL_WIDTH}" y="{y - 8}" width="{width:.1f}" height="16" fill="{color}"/>')
+        parts.append(svg_text(LABEL_WIDTH + width + 6, y + 4, format(r[key], fmt), size=11))
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def summary_table(records):
+    columns = (('label', 'Run', ''), ('count', 'Passengers', ','), ('mean', 'Mean wait', '.2f'),
+               ('p95', 'p95 wait', ''), ('ticks_per_s', 'Ticks/s', ',.0f'), ('utilization', 'Utilization', '.1%'),
+               ('energy', 'Energy (units)', ',.1f'))
+    head = ''.join(f'<th>{title}</th>' for _, title, _ in columns)
+    rows = []
+    for r in records:
+        cells = ''.join(f'<td>{html.escape(format(r[key], fmt)) if r.get(key) is not None else "-"}</td>'
+                        for key, _, fmt in columns)
+        rows.append(f'<tr>{cells}</tr>')
+    return f'<table><tr>{head}</tr>{"".join(rows)}</table>'
+
+
+def render_html(records, title="Elevator System Run Comparison"):
+    sections = [
+        ('Summary', summary_table(records)),
+        ('Wait time distribution (ticks)', wait_chart(records)),
+        ('Simulation throughput (ticks/s)', bar_chart(records, 'ticks_per_s', ',.0f', theme.SUCCESS_COLOR)),
+        ('Car utilization', bar_chart(records, 'utilization', '.1%', theme.PRIMARY_COLOR)),
+    ]
+    cards = ''.join(f'<div class="card"><h2>{heading}</h2>{body}</div>' for heading, body in sections)
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{html.escape(title)}</title>
+<style>
+body {{ background: {theme.BG_COLOR}; color: {theme.TEXT_COLOR}; font-family: Helvetica, Arial, sans-serif;
+       margin: 20px; }}
+.card {{ background: {theme.CARD_COLOR}; border: 1px solid {theme.BORDER_COLOR}; padding: 15px;
+        margin-bottom: 15px; }}
+h1 {{ font-size: 20px; }}
+h2 {{ font-size: 14px; margin-top: 0; }}
+table {{ border-collapse: collapse; font-size: 12px; }}
+th, td {{ border-bottom: 1px solid {theme.BORDER_COLOR}; padding: 4px 10px; text-align: right; }}
+th:first-child, td:first-child {{ text-align: left; }}
+th {{ color: {theme.SECONDARY_COLOR}; }}
+</style></head>
+<body><h1>{html.escape(title)}</h1>{cards}</body></html>
+"""
+
+
+def render_png(records, path):
+    try:
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+    except ImportError:
+        raise RuntimeError("PNG output needs matplotlib, install it with: pip install elevator-sim[report]")
+
+    # Every run gets a row; runs without wait percentiles (benchmarks) leave the box out
+    labels = [r['label'] for r in records]
+    positions = range(len(records))
+    figure, (waits, throughput, busy) = plt.subplots(1, 3, figsize=(16, 1 + 0.4 * len(records)), sharey=True)
+    figure.patch.set_facecolor(theme.BG_COLOR)
+    for axes in (waits, throughput, busy):
+        axes.set_facecolor(theme.CARD_COLOR)
+
+    boxes = [(i, {'label': r['label'], 'whislo': r['p5'], 'q1': r['p25'], 'med': r['p50'], 'q3': r['p75'],
+                  'whishi': r['p95'], 'mean': r['mean'], 'fliers': []})
+             for i, r in enumerate(records) if has_waits(r)]
+    if boxes:
+        waits.bxp([box for _, box in boxes], positions=[i for i, _ in boxes], vert=False, showmeans=True,
+                  patch_artist=True, boxprops={'facecolor': theme.PRIMARY_COLOR, 'edgecolor': theme.BORDER_COLOR},
+                  medianprops={'color': theme.CARD_COLOR},
+                  meanprops={'marker': 'o', 'markerfacecolor': theme.WARNING_COLOR,
+                             'markeredgecolor': theme.WARNING_COLOR})
+    waits.set_yticks(list(positions), labels)
+    waits.set_title('Wait time (ticks)', color=theme.TEXT_COLOR)
+    throughput.barh(list(positions), [r.get('ticks_per_s') or 0 for r in records], color=theme.SUCCESS_COLOR)
+    throughput.set_title('Ticks/s', color=theme.TEXT_COLOR)
+    busy.barh(list(positions), [r.get('utilization') or 0 for r in records], color=theme.PRIMARY_COLOR)
+    busy.set_title('Car utilization', color=theme.TEXT_COLOR)
+
+    figure.tight_layout()
+    figure.savefig(path, facecolor=figure.get_facecolor())
+    plt.close(figure)
+
+
+def write_report(paths, html_path=None, png_path=None, recompute=False):
+    records = load_records(paths, recompute)
+    if html_path:
+        with open(html_path, 'w') as f:
+            f.write(render_html(records))
+    if png_path:
+        render_png(records, png_path)
+    return records
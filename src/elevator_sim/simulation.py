@@ -0,0 +1,142 @@
+import random
+
+from .direction import Direction
+
+STATUS_FIELDS = ('tick', 'elevator', 'floor', 'direction', 'open_doors', 'emergency', 'destinations', 'riders',
+                 'odometer')
+PASSENGER_FIELDS = ('passenger', 'origin', 'destination', 'elevator', 'arrival_tick', 'board_tick',
+                    'alight_tick', 'wait', 'ride')
+
+
+class Passenger:
+    __slots__ = ('id', 'origin', 'destination', 'arrival_tick', 'board_tick', 'alight_tick', 'elevator_id')
+
+    def __init__(self, id, origin, destination, arrival_tick):
+        self.id = id
+        self.origin = origin
+        self.destination = destination
+        self.arrival_tick = arrival_tick
+        self.board_tick = None
+        self.alight_tick = None
+        self.elevator_id = None
+
+    def direction(self):
+        return Direction.UP if self.destination > self.origin else Direction.DOWN
+
+    def record(self):
+        return (self.id, self.origin, self.destination, self.elevator_id, self.arrival_tick, self.board_tick,
+                self.alight_tick, self.board_tick - self.arrival_tick, self.alight_tick - self.board_tick)
+
+
+class Simulation:
+    # Drives an ElevatorSystem headless: passengers arrive from a traffic profile, press
+    # a hall call, board whichever car opens its doors at their floor and press their
+    # destination inside. Only passengers still in the building are kept in memory.
+    def __init__(self, system, traffic, min_floor=0, max_floor=9, seed=None, rate_scale=1.0, parking=None,
+                 faults=None):
+        self.system = system
+        self.traffic = traffic
+        self.parking = parking
+        self.faults = faults
+        self.min_floor = min_floor
+        self.max_floor = max_floor
+        self.rate_scale = rate_scale
+        self.rng = random.Random(seed)
+
+        self.tick = 0
+        self.calls = 0
+        self.busy_car_ticks = 0
+        self.in_service_car_ticks = 0
+        self.next_passenger_id = 0
+        self.waiting = {floor: [] for floor in range(min_floor, max_floor + 1)}
+        self.riding = [[] for _ in system.elevators]
+        # Riders let out between ticks, returned by the next step
+        self.delivered = []
+
+        for elevator in system.elevators:
+            if not min_floor <= elevator.current_floor <= max_floor:
+                elevator.current_floor = min_floor
+
+    def add_passenger(self, origin, destination):
+        passenger = Passenger(self.next_passenger_id, origin, destination, self.tick)
+        self.next_passenger_id += 1
+        self.waiting[origin].append(passenger)
+        elevator = self.system.pickup(origin, passenger.direction().value)
+        self.calls += 1
+        if elevator is not None and elevator.open_doors and elevator.current_floor == origin:
+            # A car standing at the floor with its doors open takes the passenger right away
+            self.delivered.extend(self.exchange(elevator))
+        if self.parking is not None:
+            self.parking.observe(self.tick, origin)
+        return passenger
+
+    def step(self):
+        if self.faults is not None and self.faults.apply(self):
+            # Calls handed over from a failed car can open an idle car where it stands,
+            # so let people on before the next move closes the doors
+            for elevator in self.system.elevators:
+                if elevator.open_doors and not elevator.is_emergency:
+                    self.delivered.extend(self.exchange(elevator))
+        for origin, destination in self.traffic.arrivals(self.tick, self.rng, self.min_floor, self.max_floor,
+                                                         self.rate_scale):
+            self.add_passenger(origin, destination)
+
+        self.system.step()
+        self.tick += 1
+
+        delivered, self.delivered = self.delivered, []
+        for elevator in self.system.elevators:
+            if elevator.is_emergency:
+                # Out of service: doors held open, but neither busy nor available
+                continue
+            if elevator.open_doors:
+                delivered.extend(self.exchange(elevator))
+            self.in_service_car_ticks += 1
+            if elevator.open_doors or elevator.direction is not Direction.STAY:
+                self.busy_car_ticks += 1
+        if self.parking is not None:
+            self.parking.step(self.tick, self.system.elevators)
+        return delivered
+
+    def exchange(self, elevator):
+        floor = elevator.current_floor
+        riders = self.riding[elevator.id]
+
+        delivered = [p for p in riders if p.destination == floor]
+        if delivered:
+            riders[:] = [p for p in riders if p.destination != floor]
+            for passenger in delivered:
+                passenger.alight_tick = self.tick
+
+        boarding = self.waiting.get(floor)
+        if boarding:
+            self.waiting[floor] = []
+            for passenger in boarding:
+                passenger.board_tick = self.tick
+                passenger.elevator_id = elevator.id
+                self.system.press(elevator.id, passenger.destination)
+            riders.extend(boarding)
+        elevator.load = len(riders)
+        return delivered
+
+    def repress(self, elevator_ids):
+        # Riders kept inside a car taken out of service ask for their floors again. The car
+        # is back with its doors open, and step lets out anyone already at their floor.
+        for elevator_id in elevator_ids:
+            for passenger in self.riding[elevator_id]:
+                self.system.press(elevator_id, passenger.destination)
+
+    def status(self):
+        for elevator in self.system.elevators:
+            yield (self.tick, elevator.id, elevator.current_floor, elevator.direction.name, elevator.open_doors,
+                   elevator.is_emergency, elevator.get_destination_count(), len(self.riding[elevator.id]),
+                   elevator.odometer)
+
+    def utilization(self):
+        # Share of in-service car-ticks spent moving or with the doors open
+        if not self.in_service_car_ticks:
+            return 0.0
+        return self.busy_car_ticks / self.in_service_car_ticks
+
+    def in_flight(self):
+        return sum(map(len, self.waiting.values())) + sum(map(len, self.riding))
@@ -0,0 +1,10 @@
+# Colour scheme shared by the Tk front-end and the HTML reports
+BG_COLOR = '#f8f9fa'
+CARD_COLOR = '#ffffff'
+PRIMARY_COLOR = '#4e73df'
+SECONDARY_COLOR = '#6c757d'
+SUCCESS_COLOR = '#28a745'
+DANGER_COLOR = '#dc3545'
+WARNING_COLOR = '#ffc107'
+TEXT_COLOR = '#343a40'
+BORDER_COLOR = '#dee2e6'
@@ -0,0 +1,75 @@
+import pytest
+
+from elevator_sim import ElevatorSystem
+from elevator_sim.equivalence import KernelEngine, ReferenceEngine, check_equivalence, fuzz, fuzz_random
+from elevator_sim.faults import OUTAGE, FaultInjector, FaultSchedule
+from elevator_sim.simulation import Simulation
+from elevator_sim.traffic import get_profile
+
+
+def test_kernel_matches_reference_on_random_scripts():
+    assert fuzz_random(KernelEngine, runs=100, seed=1) is None
+
+
+def test_kernel_matches_reference_on_hypothesis_scripts():
+    pytest.importorskip('hypothesis')
+    fuzz(KernelEngine, max_examples=100, seed=1)
+
+
+def test_reference_matches_itself():
+    assert fuzz_random(ReferenceEngine, runs=20, seed=2) is None
+
+
+@pytest.mark.parametrize('script', [
+    # Hall calls rebalanced in the middle of a batched kernel step
+    [('pickup', 1, 1), ('pickup', 1, -1), ('add', 1, 6, 1), ('step', 11)],
+    [('pickup', 11, 1), ('step', 1), ('pickup', 11, -1), ('step', 11)],
+    # An idle car called to its own floor opens in place
+    [('pickup', 0, -1), ('step', 1), ('pickup', 0, 1), ('step', 5)],
+    # Calls of a failed car handed to an idle car standing at the floor
+    [('add', 1, 3, 1), ('step', 4), ('pickup', 3, 1), ('emergency', 0, True), ('step', 20)],
+])
+def test_kernel_regressions(script):
+    check_equivalence(KernelEngine, 2, script)
+
+
+def test_idle_car_opens_in_place():
+    system = ElevatorSystem(1)
+    elevator = system.pickup(0, -1)
+    assert elevator.open_doors
+    assert elevator.current_floor == 0
+    assert not system.hall_calls
+    system.step(5)
+    assert elevator.current_floor == 0
+
+
+def test_failed_car_handover_does_not_strand_passengers():
+    schedule = FaultSchedule()
+    schedule.add(OUTAGE, 0, 1, 1000)
+    system = ElevatorSystem(2)
+    system.elevators[1].current_floor = 3
+    simulation = Simulation(system, get_profile('none'), 0, 9, seed=1, faults=FaultInjector(schedule))
+    simulation.add_passenger(3, 7)
+
+    delivered = []
+    for _ in range(200):
+        delivered.extend(simulation.step())
+    assert len(delivered) == 1
+    assert simulation.in_flight() == 0
+    assert not system.hall_calls
+
+
+def test_gui_asks_for_destination_when_car_opens_in_place():
+    pytest.importorskip('tkinter')
+    from elevator_sim.gui import ElevatorSystemGUI
+
+    # Only the call handling is exercised, without opening a window
+    gui = ElevatorSystemGUI.__new__(ElevatorSystemGUI)
+    gui.system = ElevatorSystem(2)
+    gui.max_floor = 9
+    asked = []
+    gui.ask_if_destination = lambda elevator_id, floor: asked.append((elevator_id, floor))
+    gui.update_visuals = lambda: None
+
+    gui.pickup(0)
+    assert asked == [(0, 0)]